@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import re
 from typing import Dict, List, Tuple
 
 from api.agents.base_agent import BaseAgent
@@ -11,7 +10,7 @@ from api.models.lint_models import (
     FindingLocation,
 )
 from api.rules_library import RuleLibrary
-from api.rules_models import CheckType, Rule, Severity, DetectionScope, RuleSource
+from api.rules_models import CheckType, Rule, Severity, DetectionScope
 
 
 class GeneralStructureAgent(BaseAgent):
@@ -39,15 +38,14 @@ class GeneralStructureAgent(BaseAgent):
         context: LintContext,
         profile: DocumentProfile,
     ) -> List[Finding]:
-        rules: List[Rule] = self.rule_library.get_rules_for_agent(self.agent_id)
-                is_international = context.profile_variant == "apa7_international"
+        rules: List[Rule] = self.rule_library.get_rules_for_agent(
+            self.agent_id, context.profile_variant
+        )
         findings: List[Finding] = []
 
         if not document_text:
             # Documento vacío: todas las reglas estructurales/regex fallan de facto.
             for rule in rules:
-                            if is_international and rule.source == RuleSource.LOCAL:
-                                                continue
                 findings.append(self._build_finding_empty_doc(rule))
             return findings
 
@@ -184,16 +182,13 @@ class GeneralStructureAgent(BaseAgent):
         Devuelve True si la regla regex a nivel documento se considera VIOLADA.
         Es decir: si NINGÚN patrón de detection_hints.regex aparece.
         """
-        patterns = rule.detection_hints.regex or []
+        patterns = rule.detection_hints.compiled_regex
         if not patterns:
             return False
 
         for pattern in patterns:
-            try:
-                if re.search(pattern, document_text, flags=re.MULTILINE):
-                    return False  # se cumple
-            except re.error:
-                continue
+            if pattern.search(document_text):
+                return False  # se cumple
 
         return True  # no se encontró ningún patrón
 
@@ -216,7 +211,7 @@ class GeneralStructureAgent(BaseAgent):
         - Si en ninguna sección objetivo se encuentra ningún patrón → violación.
         """
         section_targets = rule.detection_hints.section_targets or []
-        patterns = rule.detection_hints.regex or []
+        patterns = rule.detection_hints.compiled_regex
 
         if not section_targets or not patterns:
             return False
@@ -250,11 +245,8 @@ class GeneralStructureAgent(BaseAgent):
             block = get_section_block(start_line)
 
             for pattern in patterns:
-                try:
-                    if re.search(pattern, block, flags=re.MULTILINE):
-                        return False  # se cumple en al menos una sección objetivo
-                except re.error:
-                    continue
+                if pattern.search(block):
+                    return False  # se cumple en al menos una sección objetivo
 
         # Si llegamos aquí, no se encontró ningún patrón en ninguna sección objetivo
         return True
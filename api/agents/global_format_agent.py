@@ -10,7 +10,7 @@ from api.models.lint_models import (
     FindingLocation,
 )
 from api.rules_library import RuleLibrary
-from api.rules_models import Rule, RuleSource
+from api.rules_models import Rule
 
 
 class GlobalFormatAgent(BaseAgent):
@@ -46,17 +46,12 @@ class GlobalFormatAgent(BaseAgent):
             return findings
 
         # Obtener reglas para este agente
-        rules: List[Rule] = self.rule_library.get_rules_for_agent(self.agent_id)
+        rules: List[Rule] = self.rule_library.get_rules_for_agent(
+            self.agent_id, context.profile_variant
+        )
         
-        # Determinar si es perfil internacional
-        is_international = context.profile_variant == "apa7_international"
-
         # Procesar cada regla
         for rule in rules:
-            # Omitir reglas LOCAL si es perfil internacional
-            if is_international and rule.source == RuleSource.LOCAL:
-                continue
-
             # Validar según el tipo de regla
             if rule.rule_id == "CUN-GF-001":
                 finding = self._validate_font(rule, context.metadata)
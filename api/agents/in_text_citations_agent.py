@@ -11,7 +11,7 @@ from api.models.lint_models import (
     FindingLocation,
 )
 from api.rules_library import RuleLibrary
-from api.rules_models import Rule, CheckType, RuleSource
+from api.rules_models import Rule, CheckType
 
 
 CITATION_PARENTHETICAL_PATTERN = re.compile(
@@ -57,8 +57,9 @@ class InTextCitationsAgent(BaseAgent):
         context: LintContext,
         profile: DocumentProfile,
     ) -> List[Finding]:
-        rules: List[Rule] = self.rule_library.get_rules_for_agent(self.agent_id)
-                is_international = context.profile_variant == "apa7_international"
+        rules: List[Rule] = self.rule_library.get_rules_for_agent(
+            self.agent_id, context.profile_variant
+        )
         findings: List[Finding] = []
 
         # Normalizamos texto para análisis simple
@@ -66,8 +67,6 @@ class InTextCitationsAgent(BaseAgent):
         upper_text = text.upper()
 
         for rule in rules:
-                        if is_international and rule.source == RuleSource.LOCAL:
-                                            continue
             # Usamos rule_id para decidir la lógica de detección;
             # checkType se respeta pero no limita aquí.
             if rule.rule_id == "CUN-IC-001":
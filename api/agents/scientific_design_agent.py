@@ -11,7 +11,7 @@ from api.models.lint_models import (
     FindingLocation,
 )
 from api.rules_library import RuleLibrary
-from api.rules_models import Rule, RuleSource
+from api.rules_models import Rule
 
 
 RE_SECTION_HEADER = re.compile(r"^[A-ZÁÉÍÓÚÑ ]{3,}$")
@@ -53,8 +53,9 @@ class ScientificDesignAgent(BaseAgent):
             # No aplicamos estas reglas a ACAs ni a otros tipos de documento.
             return findings
 
-        rules: List[Rule] = self.rule_library.get_rules_for_agent(self.agent_id)
-                is_international = context.profile_variant == "apa7_international"
+        rules: List[Rule] = self.rule_library.get_rules_for_agent(
+            self.agent_id, context.profile_variant
+        )
         text = document_text or ""
         lines = _normalize_lines(text)
         upper_lines = [ln.upper() for ln in lines]
@@ -62,8 +63,6 @@ class ScientificDesignAgent(BaseAgent):
         section_indices = self._detect_section_headers(upper_lines)
 
         for rule in rules:
-                        if is_international and rule.source == RuleSource.LOCAL:
-                                            continue
             if rule.rule_id == "CUN-SD-001":
                 findings.extend(
                     self._check_sd_001_problem_and_objectives(
@@ -1,19 +1,42 @@
 from __future__ import annotations
 
-from datetime import datetime
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 
 from api.models.lint_models import LintRequest, LintResponse
 from api.orchestrator.lint_orchestrator import LintOrchestrator
 from api.rules_library import RuleLibrary
 from api.routes import coach_router
+from api.services.lint_cache import LintResponseCache, wants_recompute
+
+# Con APA7_WATCH_RULES=1 se recargan en caliente los *.rules.json que
+# cambien en disco (requiere el paquete opcional `watchdog`; solo desarrollo).
+WATCH_RULES_ENV = "APA7_WATCH_RULES"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Arranca y detiene el observador de reglas si está activado por entorno."""
+    rule_library = _build_rule_library()
+    if os.getenv(WATCH_RULES_ENV) == "1":
+        rule_library.watch()
+    try:
+        yield
+    finally:
+        rule_library.stop_watching()
+
 
 app = FastAPI(
     title="APA7 Compliance Engine Backend",
     version="1.0.0",
     description="Motor de linting APA 7 + CUN basado en múltiples agentes.",
+    lifespan=lifespan,
 )
 
 # Directorio base = carpeta api
@@ -21,17 +44,60 @@ BASE_DIR = Path(__file__).parent
 
 # Cargamos la biblioteca de reglas desde api/rules/apa7_cun/*.rules.json
 RULES_BASE_DIR = BASE_DIR / "rules"
-rule_library = RuleLibrary(base_dir=RULES_BASE_DIR, profile_id="apa7_cun")
 
-# Orquestador principal
-orchestrator = LintOrchestrator(rule_library=rule_library)
+
+@lru_cache(maxsize=1)
+def _build_rule_library() -> RuleLibrary:
+    """
+    Biblioteca de reglas compartida por todo el proceso.
+
+    Se construye una sola vez; RuleLibrary.reload() recarga en sitio,
+    así que no hace falta invalidar esta caché.
+    """
+    return RuleLibrary(base_dir=RULES_BASE_DIR, profile_id="apa7_cun")
+
+
+@lru_cache(maxsize=1)
+def _build_orchestrator() -> LintOrchestrator:
+    """Orquestador principal, compartido entre requests."""
+    return LintOrchestrator(rule_library=_build_rule_library())
+
+
+# Las dependencias son `async def`: FastAPI ejecuta las síncronas en su
+# threadpool, y no merece la pena un salto de hilo por leer un singleton.
+async def get_rule_library() -> RuleLibrary:
+    """Dependencia FastAPI: biblioteca de reglas del proceso."""
+    return _build_rule_library()
+
+
+async def get_orchestrator() -> LintOrchestrator:
+    """Dependencia FastAPI: orquestador del proceso."""
+    return _build_orchestrator()
+
+
+# Precargamos reglas y orquestador al arrancar, no en el primer request
+_build_orchestrator()
+
+# Caché de respuestas de /lint (payloads idénticos dentro del TTL)
+lint_cache = LintResponseCache(maxsize=1024, ttl_seconds=300.0)
 
 # Registrar routers adicionales
 app.include_router(coach_router.router)
 
 
+@lru_cache(maxsize=1)
+def _cached_ts(int_second: int) -> str:
+    """
+    Timestamp ISO (UTC) con granularidad de 1 segundo.
+
+    /health se consulta con mucha frecuencia desde los balanceadores;
+    así evitamos construir un datetime nuevo en cada llamada.
+    """
+    return datetime.fromtimestamp(int_second, tz=timezone.utc).isoformat()
+
+
 @app.get("/health")
-async def health() -> dict:
+async def health(rule_library: RuleLibrary = Depends(get_rule_library)) -> dict:
     """
     Endpoint de salud básico.
 
@@ -42,13 +108,16 @@ async def health() -> dict:
     """
     return {
         "status": "ok",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _cached_ts(int(time.time())),
         "rule_agents": rule_library.get_all_agent_ids(),
     }
 
 
 @app.post("/lint", response_model=LintResponse)
-async def lint(request: LintRequest) -> LintResponse:
+async def lint(
+    request: LintRequest,
+    orchestrator: LintOrchestrator = Depends(get_orchestrator),
+) -> LintResponse:
     """
     Ejecuta el análisis APA7+CUN sobre el documento enviado.
 
@@ -56,9 +125,20 @@ async def lint(request: LintRequest) -> LintResponse:
       - LintRequest con document_text y context.
     Devuelve:
       - LintResponse con findings, summary, perfil y metadatos.
+
+    Las respuestas se cachean por contenido; enviar
+    `context.metadata.force_recompute = true` fuerza un nuevo análisis.
     """
     # Propagar metadata desde request a context si está presente
     if request.metadata and request.context.metadata is None:
         request.context.metadata = request.metadata
-    
-    return await orchestrator.run(request)
+
+    cache_key = lint_cache.make_key(request)
+    if not wants_recompute(request):
+        cached = lint_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    response = await orchestrator.lint_document(request)
+    lint_cache.set(cache_key, response)
+    return response
@@ -25,7 +25,7 @@ class CoachMode(str, Enum):
     PLAN_SECTION = "PLAN_SECTION"
     REVIEW_SECTION = "REVIEW_SECTION"
     CLARIFY_INSTRUCTIONS = "CLARIFY_INSTRUCTIONS"
-        DETECT_PROFILE = "DETECT_PROFILE"
+    DETECT_PROFILE = "DETECT_PROFILE"
 
 
 class PaperProfile(str, Enum):
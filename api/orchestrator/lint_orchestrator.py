@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from functools import lru_cache
+from operator import attrgetter
 from time import perf_counter
-from typing import List
+from typing import FrozenSet, List, Optional, Tuple
 
 from api.agents.base_agent import BaseAgent
 from api.agents.document_profile_agent import DocumentProfileAgent
@@ -16,10 +20,30 @@ from api.agents.references_agent import ReferencesAgent
 from api.agents.global_format_agent import GlobalFormatAgent
 from api.agents.metadata_consistency_agent import MetadataConsistencyAgent
 
-from api.models.lint_models import LintRequest, LintResponse, LintSummary
+from api.models.lint_models import (
+    DocumentProfile,
+    Finding,
+    LintContext,
+    LintRequest,
+    LintResponse,
+    LintSummary,
+)
 from api.rules_library import RuleLibrary
 from api.rules_models import Severity
 
+logger = logging.getLogger(__name__)
+
+# Max number of agents running concurrently per lint request.
+DEFAULT_AGENT_CONCURRENCY = 4
+
+_get_severity = attrgetter("severity")
+
+
+def _location_key(f: Finding):
+    """Sort key for findings: (line or 0, start_offset or 0)."""
+    loc = f.location
+    return (loc.line or 0, loc.start_offset or 0) if loc else (0, 0)
+
 
 class LintOrchestrator:
     """
@@ -31,8 +55,13 @@ class LintOrchestrator:
         3) Aggregate all findings and return a uniform LintResponse.
     """
 
-    def __init__(self, rule_library: RuleLibrary) -> None:
+    def __init__(
+        self,
+        rule_library: RuleLibrary,
+        agent_concurrency: int = DEFAULT_AGENT_CONCURRENCY,
+    ) -> None:
         self.rule_library = rule_library
+        self.agent_concurrency = agent_concurrency
 
         # Special agent (does NOT implement BaseAgent): returns (profile, findings)
         self.document_profile_agent = DocumentProfileAgent(rule_library)
@@ -49,6 +78,16 @@ class LintOrchestrator:
                         MetadataConsistencyAgent(rule_library),
         ]
 
+        # Per-instance cache of requested agent subsets
+        self._all_agents_tuple: Tuple[BaseAgent, ...] = tuple(self.agents)
+        self._select = lru_cache(maxsize=32)(self._select_agents)
+
+    def _select_agents(self, ids: Optional[FrozenSet[str]]) -> Tuple[BaseAgent, ...]:
+        """Agents to run for a requested id set (None = all), in registration order."""
+        if not ids:
+            return self._all_agents_tuple
+        return tuple(a for a in self.agents if a.agent_id in ids)
+
     async def lint_document(self, request: LintRequest) -> LintResponse:
         start_time = perf_counter()
         text = request.text
@@ -60,50 +99,29 @@ class LintOrchestrator:
         context = request.context  # has page_count, etc.
 
         # 2. Run other agents in parallel
-        # Agent filtering logic
-        requested_agents: set[str] | None = None
-        if request.options and request.options.agents:
-            requested_agents = set(request.options.agents)
-
-        agents_to_run = self.agents
-        if requested_agents:
-            agents_to_run = [agent for agent in self.agents if agent.agent_id in requested_agents]
+        # Agent filtering logic (cached per requested subset)
+        agents_to_run = self._select(
+            frozenset(request.options.agents)
+            if request.options and request.options.agents
+            else None
+        )
 
-        # Gather tasks
-        tasks = []
-        for agent in agents_to_run:
-            tasks.append(agent.run(text, context, profile))
+        all_findings = list(profile_findings)
 
-        results_list = await asyncio.gather(*tasks, return_exceptions=True)
+        # Profile-only request (no known agent requested): skip scheduling entirely
+        if agents_to_run:
+            all_findings.extend(await self._run_agents(agents_to_run, text, context, profile))
 
-        # 3. Aggregate findings
-        all_findings = list(profile_findings)
+        # Calculate stats (Counter + attrgetter run the loop in C).
+        # APA7 severities map to error / warning / suggestion (reported as "info").
+        counts = Counter(map(_get_severity, all_findings))
+        error_count = counts.get(Severity.error, 0)
+        warning_count = counts.get(Severity.warning, 0)
+        info_count = counts.get(Severity.suggestion, 0)
 
-        for res in results_list:
-            if isinstance(res, list):
-                all_findings.extend(res)
-            else:
-                # If an exception occurred, we could log it or add a system finding.
-                # For now, just print/ignore
-                print(f"Agent error: {res}")
-
-        # Calculate stats
-        error_count = sum(1 for f in all_findings if f.severity == Severity.ERROR)
-        warning_count = sum(1 for f in all_findings if f.severity == Severity.WARNING)
-        info_count = sum(1 for f in all_findings if f.severity == Severity.INFO)
-        # suggestion/typo? APA7 generally maps to these 3.
-
-        # Sort findings by location (if possible)
-        # A simple sort key: (page or 0, line or 0, start_offset or 0)
-        def sort_key(f):
-            loc = f.location
-            return (
-                loc.page if loc and loc.page else 0,
-                loc.line if loc and loc.line else 0,
-                loc.start_offset if loc and loc.start_offset else 0,
-            )
-
-        all_findings.sort(key=sort_key)
+        # Sort findings by location: (line or 0, start_offset or 0)
+        if len(all_findings) > 1:
+            all_findings.sort(key=_location_key)
 
         duration = perf_counter() - start_time
 
@@ -114,7 +132,7 @@ class LintOrchestrator:
             info=info_count,
             compliance_score=self._calculate_score(error_count, warning_count),
             processing_time_ms=int(duration * 1000),
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=datetime.now(timezone.utc).isoformat(),
         )
 
         return LintResponse(
@@ -124,6 +142,49 @@ class LintOrchestrator:
             findings=all_findings,
         )
 
+    async def _run_agents(
+        self,
+        agents: Tuple[BaseAgent, ...],
+        text: str,
+        context: LintContext,
+        profile: DocumentProfile,
+    ) -> List[Finding]:
+        """Run agents with bounded concurrency and return their findings in agent order."""
+        # Bounded concurrency: at most `agent_concurrency` agents at once.
+        # A fresh semaphore per call keeps the cap per request (the
+        # orchestrator is a process-wide singleton) and binds it to the
+        # loop that is actually running this request.
+        sem = asyncio.Semaphore(self.agent_concurrency)
+
+        async def _run_bounded(index: int, agent: BaseAgent):
+            async with sem:
+                try:
+                    return index, await agent.run(text, context, profile)
+                except Exception as exc:
+                    # Log and keep going; a failing agent contributes no findings.
+                    logger.error(
+                        "Agent %s raised",
+                        getattr(agent, "agent_id", "?"),
+                        exc_info=(type(exc), exc, exc.__traceback__),
+                    )
+                    return index, []
+
+        tasks = [
+            asyncio.create_task(_run_bounded(i, agent))
+            for i, agent in enumerate(agents)
+        ]
+
+        # Aggregate findings as agents finish (kept in agent order for stable output)
+        results_list: List[List[Finding]] = [[] for _ in tasks]
+        for fut in asyncio.as_completed(tasks):
+            index, res = await fut
+            results_list[index] = res
+
+        findings: List[Finding] = []
+        for res in results_list:
+            findings.extend(res)
+        return findings
+
     def _calculate_score(self, errors: int, warnings: int) -> float:
         """
         Simple scoring logic:
@@ -1,4 +1,7 @@
+from functools import lru_cache
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from api.models.coach import (
     CoachRequest,
     CoachResponse,
@@ -11,11 +14,15 @@ from api.models.coach import (
 from typing import Optional
 from api.services.coach_service import CoachService
 
-router = APIRouter(prefix="/coach", tags=["coach"])
+router = APIRouter(prefix="/coach", tags=["coach"], default_response_class=ORJSONResponse)
 
+@lru_cache(maxsize=1)
 def get_coach_service(llm_client: Optional['BaseLLMClient'] = None) -> CoachService:
     """
     Construye una instancia de CoachService con el cliente LLM.
+
+    La instancia se cachea: la configuración es global al proceso y así no
+    se reconstruye el servicio en cada request.
     
     Args:
         llm_client: Cliente LLM opcional. Si no se proporciona, el servicio funcionara en modo degradado.
@@ -66,80 +73,111 @@ async def coach_endpoint(request: CoachRequest) -> CoachResponse:
 # --------- Construccion de prompts / personalidad del coach --------- #
 
 
+_APA7_GLOBAL_BASE = (
+    "Eres un COACH ACADEMICO especializado en la 7a edicion del "
+    "Publication Manual of the American Psychological Association (APA 7, 2019).\n"
+)
+
+_CUN_BASE = (
+    "Eres un COACH ACADEMICO especializado en la Corporacion Unificada Nacional "
+    "de Educacion Superior (CUN) y en normas APA 7a edicion.\n"
+    "Primero respetas el estandar APA 7 internacional y luego aplicas "
+    "las adaptaciones CUN cuando existan.\n"
+)
+
+_STUDENT_SUFFIX = (
+    "Estas trabajando con un TRABAJO DE ESTUDIANTE (student paper). "
+    "Debes:\n"
+    "- Priorizar elementos propios de trabajos de curso (portada, curso, docente, fecha, etc.).\n"
+    "- Ser pedagogico y explicar la norma APA 7 de forma clara.\n"
+    "- Cuidar citas, referencias, estructura basica y tono academico.\n"
+)
+
+_PROFESSIONAL_SUFFIX = (
+    "Estas trabajando con un MANUSCRITO PROFESIONAL (professional paper). "
+    "Debes:\n"
+    "- Priorizar estructuras tipo articulo de revista (introduccion, metodo, resultados, discusion).\n"
+    "- Ser mas estricto con formato de secciones, tablas, figuras y referencias.\n"
+)
+
+_TAIL = (
+    "Tu funcion NO es escribir el trabajo completo, sino ayudar a planear secciones, "
+    "detectar problemas de forma (APA) y dar feedback para que el autor mejore su propio texto.\n"
+    "Responde SIEMPRE en ESPANOL.\n"
+    "Evita dar parrafos completos listos para entregar; centra tu respuesta en esquemas, "
+    "consejos, fortalezas, mejoras y proximos pasos.\n"
+)
+
+
+@lru_cache(maxsize=8)
 def build_system_prompt(profile: CoachProfile, paper_profile: PaperProfile) -> str:
     """
     SYSTEM prompt base que define el rol del coach segun:
     - perfil de norma (APA7 global vs CUN)
     - tipo de documento (student paper vs professional paper)
-    """
-    base: str
-
-    if profile == CoachProfile.APA7_GLOBAL:
-        base = (
-            "Eres un COACH ACADEMICO especializado en la 7a edicion del "
-            "Publication Manual of the American Psychological Association (APA 7, 2019).\n"
-        )
-    else:
-        base = (
-            "Eres un COACH ACADEMICO especializado en la Corporacion Unificada Nacional "
-            "de Educacion Superior (CUN) y en normas APA 7a edicion.\n"
-            "Primero respetas el estandar APA 7 internacional y luego aplicas "
-            "las adaptaciones CUN cuando existan.\n"
-        )
-
-    if paper_profile == PaperProfile.STUDENT_PAPER:
-        base += (
-            "Estas trabajando con un TRABAJO DE ESTUDIANTE (student paper). "
-            "Debes:\n"
-            "- Priorizar elementos propios de trabajos de curso (portada, curso, docente, fecha, etc.).\n"
-            "- Ser pedagogico y explicar la norma APA 7 de forma clara.\n"
-            "- Cuidar citas, referencias, estructura basica y tono academico.\n"
-        )
-    else:
-        base += (
-            "Estas trabajando con un MANUSCRITO PROFESIONAL (professional paper). "
-            "Debes:\n"
-            "- Priorizar estructuras tipo articulo de revista (introduccion, metodo, resultados, discusion).\n"
-            "- Ser mas estricto con formato de secciones, tablas, figuras y referencias.\n"
-        )
-
-    base += (
-        "Tu funcion NO es escribir el trabajo completo, sino ayudar a planear secciones, "
-        "detectar problemas de forma (APA) y dar feedback para que el autor mejore su propio texto.\n"
-        "Responde SIEMPRE en ESPANOL.\n"
-        "Evita dar parrafos completos listos para entregar; centra tu respuesta en esquemas, "
-        "consejos, fortalezas, mejoras y proximos pasos.\n"
-    )
 
-    return base
+    Solo hay 4 combinaciones posibles, asi que el resultado se memoiza.
+    """
+    base = _APA7_GLOBAL_BASE if profile == CoachProfile.APA7_GLOBAL else _CUN_BASE
+    suffix = _STUDENT_SUFFIX if paper_profile == PaperProfile.STUDENT_PAPER else _PROFESSIONAL_SUFFIX
+    return base + suffix + _TAIL
 
 
-def _context_block(ctx: CoachContext) -> str:
-    """Construye un bloque de contexto textual a partir del CoachContext."""
-    return f"""
+_CTX_TEMPLATE = """
 [CONTEXTO DEL DOCUMENTO]
 
-- Perfil de documento (APA): {ctx.paper_profile.value}
-- Autor: {ctx.author_role or "N/D"}
-- Audiencia: {ctx.audience_role or "N/D"}
-- Perfiles de validacion activos: {", ".join(ctx.validation_profiles) or "N/D"}
-- Curso: {ctx.course or "N/D"}
-- Programa: {ctx.program or "N/D"}
-- Semestre: {ctx.semester or "N/D"}
-- Institucion: {ctx.institution or "N/D"}
-- Tema central: {ctx.topic or "N/D"}
+- Perfil de documento (APA): {paper_profile}
+- Autor: {author_role}
+- Audiencia: {audience_role}
+- Perfiles de validacion activos: {validation_profiles}
+- Curso: {course}
+- Programa: {program}
+- Semestre: {semester}
+- Institucion: {institution}
+- Tema central: {topic}
 
 INSTRUCCIONES DEL DOCENTE / ACA:
 ---
-{ctx.aca_instructions or "Sin instrucciones especificas."}
+{aca_instructions}
 ---
 
 GUIAS INSTITUCIONALES:
 ---
-{ctx.local_guidelines or "No se proporcionaron guias institucionales adicionales."}
+{local_guidelines}
 ---
 """
 
+_CTX_DEFAULTS = {
+    "aca_instructions": "Sin instrucciones especificas.",
+    "local_guidelines": "No se proporcionaron guias institucionales adicionales.",
+}
+
+
+class _NDMap(dict):
+    """Mapa para format_map: las claves ausentes se rellenan con "N/D" (o su default)."""
+
+    def __missing__(self, key: str) -> str:
+        return _CTX_DEFAULTS.get(key, "N/D")
+
+
+def _context_block(ctx: CoachContext) -> str:
+    """Construye un bloque de contexto textual a partir del CoachContext."""
+    values = {
+        "paper_profile": ctx.paper_profile.value,
+        "author_role": ctx.author_role,
+        "audience_role": ctx.audience_role,
+        "validation_profiles": ", ".join(ctx.validation_profiles),
+        "course": ctx.course,
+        "program": ctx.program,
+        "semester": ctx.semester,
+        "institution": ctx.institution,
+        "topic": ctx.topic,
+        "aca_instructions": ctx.aca_instructions,
+        "local_guidelines": ctx.local_guidelines,
+    }
+    # Solo pasamos los valores presentes; el resto lo resuelve _NDMap.__missing__
+    return _CTX_TEMPLATE.format_map(_NDMap((k, v) for k, v in values.items() if v))
+
 
 # --------- Handlers por modo --------- #
 
@@ -1,9 +1,36 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from api.rules_models import RuleFile, Rule
+from api.rules_models import RuleFile, Rule, RuleSource
+
+
+logger = logging.getLogger(__name__)
+
+
+# Variantes de perfil (LintContext.profile_variant) y cómo filtran las reglas.
+# None / "cun_official" -> todas las reglas; "apa7_international" -> sin reglas LOCAL.
+PROFILE_VARIANTS: Tuple[Optional[str], ...] = (None, "cun_official", "apa7_international")
+
+# Máximo de hilos para leer/validar archivos de reglas en paralelo.
+MAX_LOAD_WORKERS = 8
+
+RULE_FILE_SUFFIX = ".rules.json"
+
+
+def _parse_rule_file(path: Path) -> RuleFile:
+    """
+    Lee y valida un único *.rules.json.
+
+    Se pasan los bytes tal cual a pydantic-core, que parsea y valida en una
+    sola pasada sin decodificar antes a str ni construir un dict intermedio.
+    """
+    return RuleFile.model_validate_json(path.read_bytes())
 
 
 class RuleLibrary:
@@ -43,9 +70,18 @@ class RuleLibrary:
         self.base_dir = base_dir
         self.profile_id = profile_id
 
-        # Índices internos
+        # Índices internos. Se reemplazan completos (nunca se vacían en sitio),
+        # así los lectores concurrentes siempre ven un estado consistente.
+        # _files_by_name (nombre de archivo -> RuleFile) es la fuente de la que
+        # se derivan los demás; permite recargar o quitar un único archivo.
+        self._files_by_name: Dict[str, RuleFile] = {}
         self._by_agent: Dict[str, RuleFile] = {}
         self._by_rule_id: Dict[str, Rule] = {}
+        self._agent_variant_cache: Dict[Tuple[str, Optional[str]], List[Rule]] = {}
+
+        # Serializa las escrituras (reload / _reload_one desde el watcher)
+        self._lock = threading.RLock()
+        self._observer = None
 
         self._load_all()
 
@@ -56,41 +92,139 @@ class RuleLibrary:
         """
         Carga todos los archivos *.rules.json del perfil indicado.
 
+        La lectura y validación de cada archivo se reparte en un
+        ThreadPoolExecutor; la indexación posterior es secuencial para
+        conservar la semántica de "gana la primera aparición".
+
         No lanza excepción si el directorio no existe; simplemente
         deja la librería vacía (útil en entornos de desarrollo).
         """
+        paths = self._rule_paths()
+        rule_files: List[RuleFile] = []
+        if paths:
+            with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(paths))) as executor:
+                rule_files = list(executor.map(_parse_rule_file, paths))
+
+        self._index({path.name: rf for path, rf in zip(paths, rule_files)})
+
+    def _rule_paths(self) -> List[Path]:
+        """
+        Lista los *.rules.json del perfil; vacía si el directorio no existe.
+
+        Se ordenan por nombre para que "gana la primera aparición" no dependa
+        del orden en que el sistema de archivos devuelve el glob.
+        """
         profile_dir = self.base_dir / self.profile_id
         if not profile_dir.exists():
             # Podrías añadir logging aquí si lo deseas.
-            return
+            return []
+        return sorted(profile_dir.glob("*" + RULE_FILE_SUFFIX))
+
+    def _index(self, files_by_name: Dict[str, RuleFile]) -> None:
+        """
+        Construye los índices internos a partir de los RuleFile ya parseados
+        (por nombre de archivo) y los publica de una vez (swap atómico de
+        referencias). Los archivos se recorren ordenados por nombre.
+        """
+        rule_files = [files_by_name[name] for name in sorted(files_by_name)]
+
+        # Indexamos por agentId
+        by_agent = {rf.agent_id: rf for rf in rule_files}
+
+        # Indexamos cada regla por ruleId global.
+        # Recorremos en orden inverso para que, ante duplicados, se conserve
+        # la primera aparición (la comprensión se queda con la última escrita).
+        # TODO: loggear warning de duplicado.
+        by_rule_id = {
+            rule.rule_id: rule
+            for rf in reversed(rule_files)
+            for rule in reversed(rf.rules)
+        }
+
+        variant_cache = self._build_agent_variant_cache(by_agent)
+
+        with self._lock:
+            self._files_by_name = dict(files_by_name)
+            self._by_agent = by_agent
+            self._by_rule_id = by_rule_id
+            self._agent_variant_cache = variant_cache
 
-        for path in profile_dir.glob("*.rules.json"):
-            content = path.read_text(encoding="utf-8")
-            rule_file = RuleFile.model_validate_json(content)
+    @staticmethod
+    def _build_agent_variant_cache(
+        by_agent: Dict[str, RuleFile],
+    ) -> Dict[Tuple[str, Optional[str]], List[Rule]]:
+        """
+        Precalcula, por (agentId, variante de perfil), la lista de reglas
+        aplicables. Así get_rules_for_agent es una sola búsqueda en dict.
+        """
+        cache: Dict[Tuple[str, Optional[str]], List[Rule]] = {}
+        for agent_id, rule_file in by_agent.items():
+            for variant in PROFILE_VARIANTS:
+                if variant == "apa7_international":
+                    rules = [r for r in rule_file.rules if r.source != RuleSource.LOCAL]
+                else:
+                    rules = rule_file.rules
+                cache[(agent_id, variant)] = rules
+        return cache
+
+    def _reload_one(self, path: Path) -> None:
+        """
+        Re-parsea un único *.rules.json y lo sustituye en los índices.
+
+        Solo se lee el archivo modificado; el resto de RuleFile ya en
+        memoria se reutiliza para reconstruir los índices. Si el archivo
+        ya no existe (borrado o renombrado) se quitan sus reglas; si
+        cambió de agentId, el agente anterior deja de tenerlas. Las rutas
+        que no son *.rules.json se ignoran.
+        """
+        if not path.name.endswith(RULE_FILE_SUFFIX):
+            return
 
-            # Indexamos por agentId
-            self._by_agent[rule_file.agent_id] = rule_file
+        rule_file: Optional[RuleFile] = None
+        if path.exists():
+            try:
+                rule_file = _parse_rule_file(path)
+            except Exception:
+                # Un archivo a medio guardar o inválido no debe tumbar la librería.
+                logger.warning(
+                    "No se pudo recargar %s; se conservan las reglas previas",
+                    path,
+                    exc_info=True,
+                )
+                return
 
-            # Indexamos cada regla por ruleId global
-            for rule in rule_file.rules:
-                if rule.rule_id in self._by_rule_id:
-                    # TODO: loggear warning de duplicado.
-                    # Por ahora, conserva la primera aparición.
-                    continue
-                self._by_rule_id[rule.rule_id] = rule
+        with self._lock:
+            files_by_name = dict(self._files_by_name)
+            if rule_file is not None:
+                files_by_name[path.name] = rule_file
+            elif files_by_name.pop(path.name, None) is None:
+                return
+            self._index(files_by_name)
 
     # ------------------------------------------------------------------
     # API PÚBLICA PARA AGENTES / ORQUESTADOR
     # ------------------------------------------------------------------
-    def get_rules_for_agent(self, agent_id: str) -> List[Rule]:
+    def get_rules_for_agent(
+        self,
+        agent_id: str,
+        profile_variant: Optional[str] = None,
+    ) -> List[Rule]:
         """
         Devuelve la lista de reglas asociadas a un agente dado.
 
         :param agent_id: Identificador del agente (ej: "GENERALSTRUCTURE").
-        :return: Lista de Rule; lista vacía si el agente no tiene reglas.
+        :param profile_variant: Variante de perfil (ej: "apa7_international").
+                                Con "apa7_international" se excluyen las reglas LOCAL;
+                                una variante desconocida se trata como None.
+        :return: Lista de Rule (compartida, no mutar); lista vacía si el
+                 agente no tiene reglas.
         """
-        rule_file = self._by_agent.get(agent_id)
-        return rule_file.rules if rule_file else []
+        cache = self._agent_variant_cache
+        key = (agent_id, profile_variant.lower() if profile_variant else None)
+        rules = cache.get(key)
+        if rules is None:
+            rules = cache.get((agent_id, None), [])
+        return rules
 
     def get_rule_by_id(self, rule_id: str) -> Optional[Rule]:
         """
@@ -109,13 +243,87 @@ class RuleLibrary:
         """
         return sorted(self._by_agent.keys())
 
+    def watch(self) -> bool:
+        """
+        Observa el directorio del perfil y recarga solo los *.rules.json
+        que cambien (requiere el paquete opcional `watchdog`).
+
+        Pensado para desarrollo; sustituye a llamar reload() a mano. La app
+        lo activa al arrancar si la variable de entorno APA7_WATCH_RULES
+        está a "1" (ver api/main.py).
+
+        :return: True si el observador quedó activo, False si `watchdog`
+                 no está instalado o el directorio no existe.
+        """
+        if self._observer is not None:
+            return True
+
+        profile_dir = self.base_dir / self.profile_id
+        if not profile_dir.exists():
+            return False
+
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.warning(
+                "watchdog no está instalado; no se vigilarán cambios en %s", profile_dir
+            )
+            return False
+
+        library = self
+
+        class _RulesHandler(FileSystemEventHandler):
+            def on_modified(self, event):
+                if not event.is_directory:
+                    library._reload_one(Path(event.src_path))
+
+            on_created = on_modified
+            on_deleted = on_modified
+
+            def on_moved(self, event):
+                # Los editores que guardan de forma atómica escriben un
+                # temporal y lo renombran: recargamos origen y destino.
+                if not event.is_directory:
+                    library._reload_one(Path(event.src_path))
+                    library._reload_one(Path(event.dest_path))
+
+        observer = Observer()
+        observer.schedule(_RulesHandler(), str(profile_dir))
+        observer.daemon = True
+        observer.start()
+        self._observer = observer
+        return True
+
+    def stop_watching(self) -> None:
+        """Detiene el observador iniciado con watch(), si existe."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
     def reload(self) -> None:
         """
         Recarga todas las reglas desde disco.
 
-        Útil en desarrollo cuando se editan los *.rules.json sin
-        reiniciar el servidor.
+        Los índices nuevos se construyen aparte y se publican de una vez,
+        así las peticiones en curso nunca ven la librería vacía.
+
+        .. deprecated::
+            En desarrollo preferir watch(), que recarga solo el archivo
+            modificado. Se mantiene para tests y tooling.
         """
-        self._by_agent.clear()
-        self._by_rule_id.clear()
         self._load_all()
+
+    async def reload_async(self) -> None:
+        """
+        Variante de reload() para contextos async (ej: una ruta FastAPI).
+
+        Parsea los archivos en hilos con asyncio.to_thread para no
+        bloquear el event loop mientras se lee el disco.
+        """
+        paths = self._rule_paths()
+        rule_files = await asyncio.gather(
+            *[asyncio.to_thread(_parse_rule_file, path) for path in paths]
+        )
+        self._index({path.name: rf for path, rf in zip(paths, rule_files)})
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import re
 from enum import Enum
-from typing import List, Optional
+from functools import cached_property
+from typing import Any, List, Optional, Tuple
 
 from pydantic import BaseModel, Field, ConfigDict
 
+try:  # Motor opcional de tiempo lineal (pip install google-re2)
+    import re2
+except ImportError:  # pragma: no cover - depende del entorno
+    re2 = None
+
+# En RE2 las clases abreviadas (\s, \d, \w, \b y sus negaciones) son solo
+# ASCII, mientras que en `re` son Unicode: un NBSP (U+00A0) de un texto
+# exportado de Word casa con `\s` en `re` pero no en RE2. Los patrones que
+# las usan se quedan en `re` para no cambiar los resultados del linting.
+_RE2_UNSAFE_CLASSES = re.compile(r"\\[sSdDwWbB]")
+
 
 class Severity(str, Enum):
     """Nivel de severidad de una regla/hallazgo."""
@@ -42,7 +55,7 @@ class RuleSource(str, Enum):
 class RuleExamples(BaseModel):
     """Ejemplos de aplicación correcta e incorrecta de la regla."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     good: str
     bad: str
@@ -62,7 +75,7 @@ class RuleDetectionHints(BaseModel):
       }
     """
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     scope: DetectionScope
     section_targets: Optional[List[str]] = Field(
@@ -79,6 +92,33 @@ class RuleDetectionHints(BaseModel):
         description="Notas adicionales para el desarrollador o el motor.",
     )
 
+    @cached_property
+    def compiled_regex(self) -> Tuple[Any, ...]:
+        """
+        Patrones de `regex` compilados una sola vez (en modo multilínea).
+
+        Devuelve objetos con `.search()`: `re.Pattern` o, si `google-re2`
+        está instalado, el patrón de RE2 (motor de tiempo lineal). Solo se
+        usa RE2 cuando su semántica coincide con la de `re`; los patrones
+        con clases abreviadas (ver `_RE2_UNSAFE_CLASSES`) o que RE2 no
+        soporta (backreferences, lookaround) se compilan con `re`. Los
+        patrones inválidos se omiten, igual que hacían los agentes al
+        capturar `re.error` en cada búsqueda.
+        """
+        compiled = []
+        for pattern in self.regex or ():
+            if re2 is not None and not _RE2_UNSAFE_CLASSES.search(pattern):
+                try:
+                    compiled.append(re2.compile("(?m)" + pattern))
+                    continue
+                except re2.error:
+                    pass
+            try:
+                compiled.append(re.compile(pattern, re.MULTILINE))
+            except re.error:
+                continue
+        return tuple(compiled)
+
 
 class Rule(BaseModel):
     """
@@ -100,11 +140,15 @@ class Rule(BaseModel):
         "detectionHints": { ... },
         "autoFixHint": "..."
       }
+
+    Las reglas son datos estáticos cargados de disco y compartidos entre
+    requests, por eso el modelo es inmutable (frozen).
     """
 
     model_config = ConfigDict(
         populate_by_name=True,
         extra="ignore",
+        frozen=True,
     )
 
     rule_id: str = Field(
@@ -1,8 +1,9 @@
 from typing import Optional
-import json
 import logging
 from pathlib import Path
 
+import orjson
+
 from api.models.coach import (
     CoachRequest,
     CoachResponse,
@@ -12,6 +13,13 @@ from api.models.profile_models import DocumentProfileAnalysis
 
 logger = logging.getLogger(__name__)
 
+# Marcador de la plantilla detect_profile_es.md donde va el texto del documento
+DOCUMENT_TEXT_PLACEHOLDER = "{{DOCUMENT_TEXT}}"
+
+# Máximo de caracteres del documento que se envían al LLM en DETECT_PROFILE;
+# el inicio del documento basta para clasificar el perfil.
+MAX_DETECT_PROFILE_CHARS = 8000
+
 
 class CoachService:
     """
@@ -41,6 +49,23 @@ class CoachService:
         self.detect_profile_prompt_path = (
             Path(__file__).parent.parent / "llm" / "prompts" / "profile" / "detect_profile_es.md"
         )
+
+        # La plantilla no cambia en runtime: se lee una sola vez y se parte
+        # en prefijo/sufijo alrededor de {{DOCUMENT_TEXT}}.
+        self._detect_profile_template: Optional[str] = None
+        try:
+            self._detect_profile_template = self.detect_profile_prompt_path.read_text(
+                encoding="utf-8"
+            )
+        except FileNotFoundError:
+            logger.error(
+                f"Prompt template no encontrado en {self.detect_profile_prompt_path}"
+            )
+            self._detect_profile_prefix = self._detect_profile_suffix = ""
+        else:
+            self._detect_profile_prefix, _, self._detect_profile_suffix = (
+                self._detect_profile_template.partition(DOCUMENT_TEXT_PLACEHOLDER)
+            )
     
     async def handle(self, request: CoachRequest) -> CoachResponse:
         """
@@ -69,8 +94,8 @@ class CoachService:
         """
         Implementa la lógica de DETECT_PROFILE usando LLM.
         
-        Lee la plantilla de prompt desde detect_profile_es.md,
-        invoca el cliente LLM con el texto del documento,
+        Usa la plantilla de prompt de detect_profile_es.md (cargada en
+        __init__), invoca el cliente LLM con el texto del documento,
         parsea la respuesta JSON y retorna un CoachResponse con
         profile_analysis poblada.
         
@@ -93,16 +118,29 @@ class CoachService:
             )
         
         try:
-            # 1. Leer la plantilla de prompt
-            prompt_template = await self._load_prompt_template()
+            # 1. Verificar que la plantilla de prompt se cargó
+            if self._detect_profile_template is None:
+                raise FileNotFoundError(
+                    f"Prompt template no encontrado en {self.detect_profile_prompt_path}"
+                )
+            
+            # 2. Truncar el documento antes de construir el prompt
+            doc_text = request.document_text[:MAX_DETECT_PROFILE_CHARS]
+            if len(doc_text) < len(request.document_text):
+                logger.warning(
+                    "document_text truncado de %d a %d caracteres para DETECT_PROFILE",
+                    len(request.document_text),
+                    MAX_DETECT_PROFILE_CHARS,
+                )
             
-            # 2. Construir el prompt final reemplazando {{DOCUMENT_TEXT}}
-            user_prompt = prompt_template.replace(
-                "{{DOCUMENT_TEXT}}",
-                request.document_text,
+            # 3. Construir el prompt final insertando el texto en {{DOCUMENT_TEXT}}
+            user_prompt = (
+                self._detect_profile_prefix
+                + doc_text
+                + self._detect_profile_suffix
             )
             
-            # 3. Invocar el LLM
+            # 4. Invocar el LLM
             llm_response = await self.llm_client.generate(
                 system_prompt="Eres un experto en clasificación de documentos académicos en formato APA7.",
                 user_prompt=user_prompt,
@@ -110,10 +148,10 @@ class CoachService:
                 max_tokens=1000,
             )
             
-            # 4. Parsear la respuesta JSON
-            profile_data = json.loads(llm_response)
+            # 5. Parsear la respuesta JSON
+            profile_data = orjson.loads(llm_response)
             
-            # 5. Crear DocumentProfileAnalysis
+            # 6. Crear DocumentProfileAnalysis
             profile_analysis = DocumentProfileAnalysis(
                 isAcademic=profile_data.get("isAcademic", False),
                 apaKind=profile_data.get("apaKind", "unknown"),
@@ -125,7 +163,7 @@ class CoachService:
                 reasons=profile_data.get("reasons", []),
             )
             
-            # 6. Retornar CoachResponse con profile_analysis
+            # 7. Retornar CoachResponse con profile_analysis
             return CoachResponse(
                 success=True,
                 profile=request.profile,
@@ -133,7 +171,7 @@ class CoachService:
                 profile_analysis=profile_analysis,
             )
         
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Error parseando respuesta JSON del LLM: {e}")
             return CoachResponse(
                 success=False,
@@ -149,22 +187,3 @@ class CoachService:
                 mode=request.mode,
                 error=str(e),
             )
-    
-    async def _load_prompt_template(self) -> str:
-        """
-        Carga el contenido de la plantilla de prompt desde el archivo.
-        
-        Returns:
-            String con el contenido completo del prompt template.
-        
-        Raises:
-            FileNotFoundError: Si el archivo de prompt no existe.
-        """
-        try:
-            with open(self.detect_profile_prompt_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except FileNotFoundError:
-            logger.error(
-                f"Prompt template no encontrado en {self.detect_profile_prompt_path}"
-            )
-            raise
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+from api.models.lint_models import LintRequest, LintResponse
+
+
+FORCE_RECOMPUTE_FLAG = "force_recompute"
+
+
+def wants_recompute(request: LintRequest) -> bool:
+    """True si el cliente pidió saltarse la caché (`context.metadata.force_recompute`)."""
+    metadata = request.context.metadata or {}
+    return bool(metadata.get(FORCE_RECOMPUTE_FLAG))
+
+
+def _without_recompute_flag(metadata: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Quita el flag de recálculo; un metadata que queda vacío cuenta como None."""
+    if not metadata:
+        return None
+    rest = {k: v for k, v in metadata.items() if k != FORCE_RECOMPUTE_FLAG}
+    return rest or None
+
+
+class LintResponseCache:
+    """
+    Caché en memoria de respuestas de /lint, direccionada por contenido.
+
+    Los frontends suelen re-enviar el mismo documento (reintentos, cambios
+    de UI), así que guardamos la respuesta serializada a JSON indexada por
+    un hash del payload completo. Es un LRU acotado con TTL: las entradas
+    caducan a los `ttl_seconds` y, al superar `maxsize`, se descarta la
+    usada hace más tiempo.
+
+    No es thread-safe; está pensada para vivir en el event loop de FastAPI.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 300.0) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(request: LintRequest) -> bytes:
+        """
+        Clave estable para un request: hash del texto + hash del resto del payload.
+
+        El flag `force_recompute` no forma parte de la clave, para que una
+        petición forzada refresque la misma entrada que usan las normales.
+        Por eso se normaliza el metadata antes de hashear: `{"force_recompute":
+        true}` y `null` deben producir la misma clave.
+        """
+        text_digest = hashlib.sha256(request.document_text.encode("utf-8")).digest()
+        payload = request.model_dump(mode="json", exclude={"document_text"})
+        payload["metadata"] = _without_recompute_flag(payload["metadata"])
+        payload["context"]["metadata"] = _without_recompute_flag(payload["context"]["metadata"])
+        rest = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        return text_digest + hashlib.sha256(rest).digest()
+
+    def get(self, key: bytes) -> Optional[LintResponse]:
+        """Devuelve la respuesta cacheada o None si no existe o caducó."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, payload = entry
+        if expires_at < monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return LintResponse.model_validate_json(payload)
+
+    def set(self, key: bytes, response: LintResponse) -> None:
+        """Guarda la respuesta serializada, expulsando la entrada más antigua si hace falta."""
+        self._entries[key] = (monotonic() + self.ttl_seconds, response.model_dump_json())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
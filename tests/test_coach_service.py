@@ -1,116 +1,130 @@
 """Tests for CoachService DETECT_PROFILE mode."""
 
-import json
+import asyncio
+import copy
+import orjson
 import pytest
-from unittest.mock import MagicMock, patch
-from api.models.coach import CoachRequest, CoachMode, CoachResponse
-from api.models.profile_models import DocumentProfileAnalysis
+from unittest.mock import AsyncMock, MagicMock
+from api.models.coach import (
+    CoachContext,
+    CoachMode,
+    CoachProfile,
+    CoachRequest,
+)
+from api.models.profile_models import ApaKind, DocumentProfileAnalysis
 from api.services.coach_service import CoachService
 
 
+# Immutable test data shared by every test; never mutate it in a test.
+_VALID_PROFILE_JSON = {
+    "isAcademic": True,
+    "apaKind": "student",
+    "documentType": "informe",
+    "level": "pregrado",
+    "mode": "grupal",
+    "confidence": 0.75,
+    "suggestedProfileId": "apa7_cun_informe_pregrado_grupal",
+    "reasons": ["Portada con curso y docente", "Trabajo en equipo"],
+}
+_VALID_PROFILE_JSON_STR = orjson.dumps(_VALID_PROFILE_JSON).decode()
+
+# Requests are validated once at import; tests must not mutate them.
+_DETECT_REQ = CoachRequest(
+    profile=CoachProfile.APA7_GLOBAL,
+    mode=CoachMode.DETECT_PROFILE,
+    document_text="Este es un documento de prueba.",
+    context=CoachContext(),
+)
+_DETECT_REQ_NO_TEXT = CoachRequest(
+    profile=CoachProfile.APA7_GLOBAL,
+    mode=CoachMode.DETECT_PROFILE,
+    context=CoachContext(),
+)
+
+
 class TestCoachServiceDetectProfile:
     """Test suite for DETECT_PROFILE mode in CoachService."""
 
     @pytest.fixture
     def mock_llm_client(self):
-        """Create a mock LLM client."""
-        return MagicMock()
+        """Create a mock LLM client; `generate` is awaited, so it is an AsyncMock."""
+        client = MagicMock()
+        client.generate = AsyncMock()
+        return client
+
+    @pytest.fixture(scope="session")
+    def _coach_service_template(self):
+        """Build a prototype CoachService once (loads the prompt template)."""
+        return CoachService(llm_client=None)
 
     @pytest.fixture
-    def coach_service_with_llm(self, mock_llm_client):
+    def coach_service_with_llm(self, _coach_service_template, mock_llm_client):
         """Create a CoachService instance with mocked LLM."""
-        service = CoachService(llm_client=mock_llm_client)
+        service = copy.copy(_coach_service_template)
+        service.llm_client = mock_llm_client
         return service
 
     @pytest.fixture
-    def coach_service_without_llm(self):
+    def coach_service_without_llm(self, _coach_service_template):
         """Create a CoachService instance without LLM."""
-        service = CoachService(llm_client=None)
-        return service
-
-    @pytest.fixture
-    def valid_profile_json(self):
-        """Return a valid profile analysis JSON response."""
-        return {
-            "main_elements": ["abstract", "introduction", "methodology"],
-            "found_elements": ["abstract", "introduction"],
-            "missing_elements": ["methodology"],
-            "formatting_issues": ["Missing page numbers in header"],
-            "compliance_score": 0.75,
-            "recommendations": ["Add page numbers to header"]
-        }
+        return copy.copy(_coach_service_template)
 
-    @pytest.fixture
-    def detect_profile_request(self, valid_profile_json):
+    @pytest.fixture(scope="session")
+    def detect_profile_request(self):
         """Create a valid DETECT_PROFILE request."""
-        return CoachRequest(
-            mode=CoachMode.DETECT_PROFILE,
-            document_text="Este es un documento de prueba.",
-            context="test_context"
-        )
-
-    def test_detect_profile_with_valid_llm_response(self, coach_service_with_llm, detect_profile_request, valid_profile_json):
-        """Test DETECT_PROFILE with valid LLM response."""
-        # Mock LLM response
-        coach_service_with_llm.llm_client.generate = MagicMock(
-            return_value=json.dumps(valid_profile_json)
-        )
+        return _DETECT_REQ
+
+    @pytest.mark.parametrize(
+        "llm_return,expect_profile",
+        [
+            (_VALID_PROFILE_JSON_STR, True),
+            ("Invalid JSON response", False),
+        ],
+        ids=["valid_json", "invalid_json"],
+    )
+    def test_detect_profile_llm_responses(
+        self, coach_service_with_llm, detect_profile_request, llm_return, expect_profile
+    ):
+        """Test DETECT_PROFILE against valid and invalid LLM responses."""
+        # Mock LLM response (generate is an AsyncMock: this is what the await yields)
+        coach_service_with_llm.llm_client.generate.return_value = llm_return
 
         # Execute
-        response = coach_service_with_llm.handle(detect_profile_request)
+        response = asyncio.run(coach_service_with_llm.handle(detect_profile_request))
 
-        # Assert
+        # Assert - both cases should be handled gracefully
+        coach_service_with_llm.llm_client.generate.assert_awaited_once()
         assert response is not None
         assert response.mode == CoachMode.DETECT_PROFILE
-        assert response.profile_analysis is not None
-        assert response.profile_analysis.compliance_score == 0.75
+
+        if expect_profile:
+            # JSON response is parsed correctly into DocumentProfileAnalysis
+            assert response.success is True
+            assert isinstance(response.profile_analysis, DocumentProfileAnalysis)
+            assert response.profile_analysis.is_academic is True
+            assert response.profile_analysis.apa_kind == ApaKind.student
+            assert response.profile_analysis.confidence == 0.75
+            assert response.profile_analysis.reasons == _VALID_PROFILE_JSON["reasons"]
+        else:
+            # Invalid JSON comes back as an error response, not an exception
+            assert response.success is False
+            assert response.profile_analysis is None
 
     def test_detect_profile_with_missing_document_text(self, coach_service_with_llm):
         """Test DETECT_PROFILE request with missing document_text."""
-        # Create request without document_text
-        request = CoachRequest(
-            mode=CoachMode.DETECT_PROFILE,
-            context="test_context"
-        )
-
-        # Execute and Assert
-        response = coach_service_with_llm.handle(request)
-        assert response is not None
-        # Should handle gracefully - either error response or default
+        # Execute and Assert (request without document_text)
+        with pytest.raises(ValueError, match="document_text"):
+            asyncio.run(coach_service_with_llm.handle(_DETECT_REQ_NO_TEXT))
+        coach_service_with_llm.llm_client.generate.assert_not_called()
 
     def test_detect_profile_without_llm_client(self, coach_service_without_llm, detect_profile_request):
         """Test DETECT_PROFILE fallback when LLM client is unavailable."""
         # Execute
-        response = coach_service_without_llm.handle(detect_profile_request)
+        response = asyncio.run(coach_service_without_llm.handle(detect_profile_request))
 
         # Assert - should return valid response even without LLM
         assert response is not None
         assert response.mode == CoachMode.DETECT_PROFILE
         # Fallback behavior should be graceful
-
-    def test_detect_profile_parses_json_correctly(self, coach_service_with_llm, detect_profile_request, valid_profile_json):
-        """Test that JSON response is parsed correctly into DocumentProfileAnalysis."""
-        coach_service_with_llm.llm_client.generate = MagicMock(
-            return_value=json.dumps(valid_profile_json)
-        )
-
-        # Execute
-        response = coach_service_with_llm.handle(detect_profile_request)
-
-        # Assert
-        assert isinstance(response.profile_analysis, DocumentProfileAnalysis)
-        assert response.profile_analysis.found_elements == ["abstract", "introduction"]
-        assert response.profile_analysis.missing_elements == ["methodology"]
-
-    def test_detect_profile_handles_invalid_json(self, coach_service_with_llm, detect_profile_request):
-        """Test handling of invalid JSON from LLM."""
-        coach_service_with_llm.llm_client.generate = MagicMock(
-            return_value="Invalid JSON response"
-        )
-
-        # Execute
-        response = coach_service_with_llm.handle(detect_profile_request)
-
-        # Assert - should handle gracefully
-        assert response is not None
-        assert response.mode == CoachMode.DETECT_PROFILE
+        assert response.success is False
+        assert response.profile_analysis is None
@@ -0,0 +1,115 @@
+"""Tests for the in-memory /lint response cache."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from api.models.lint_models import (
+    DocumentProfile,
+    LintContext,
+    LintRequest,
+    LintResponse,
+    LintSummary,
+)
+from api.services import lint_cache as lint_cache_module
+from api.services.lint_cache import LintResponseCache, wants_recompute
+
+
+def _request(text="Documento de prueba.", metadata=None):
+    return LintRequest(document_text=text, context=LintContext(metadata=metadata))
+
+
+def _response(elapsed_ms=1.0):
+    return LintResponse(
+        success=True,
+        findings=[],
+        summary=LintSummary(error_count=0, warning_count=0, suggestion_count=0),
+        agents_run=["global_format"],
+        elapsed_ms=elapsed_ms,
+        profile=DocumentProfile(),
+        timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+class TestLintResponseCache:
+    """Test suite for LintResponseCache."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the cache's monotonic clock with a controllable one."""
+        now = [1000.0]
+        monkeypatch.setattr(lint_cache_module, "monotonic", lambda: now[0])
+        return now
+
+    def test_hit_returns_stored_response(self):
+        cache = LintResponseCache()
+        key = cache.make_key(_request())
+        cache.set(key, _response(elapsed_ms=12.5))
+
+        cached = cache.get(key)
+
+        assert cached == _response(elapsed_ms=12.5)
+
+    def test_miss_for_different_text(self):
+        cache = LintResponseCache()
+        cache.set(cache.make_key(_request("A")), _response())
+
+        assert cache.get(cache.make_key(_request("B"))) is None
+
+    def test_entry_expires_after_ttl(self, clock):
+        cache = LintResponseCache(ttl_seconds=10.0)
+        key = cache.make_key(_request())
+        cache.set(key, _response())
+
+        clock[0] += 9.0
+        assert cache.get(key) is not None
+
+        clock[0] += 2.0
+        assert cache.get(key) is None
+        assert key not in cache._entries
+
+    def test_evicts_least_recently_used(self):
+        cache = LintResponseCache(maxsize=2)
+        key_a, key_b, key_c = (cache.make_key(_request(t)) for t in ("A", "B", "C"))
+        cache.set(key_a, _response())
+        cache.set(key_b, _response())
+
+        # Reading A makes B the least recently used entry
+        assert cache.get(key_a) is not None
+        cache.set(key_c, _response())
+
+        assert cache.get(key_b) is None
+        assert cache.get(key_a) is not None
+        assert cache.get(key_c) is not None
+
+    @pytest.mark.parametrize(
+        "plain_metadata,forced_metadata",
+        [
+            (None, {"force_recompute": True}),
+            ({}, {"force_recompute": True}),
+            ({"user": "u1"}, {"user": "u1", "force_recompute": True}),
+        ],
+        ids=["none", "empty", "other_keys"],
+    )
+    def test_force_recompute_shares_key_with_plain_request(
+        self, plain_metadata, forced_metadata
+    ):
+        plain = _request(metadata=plain_metadata)
+        forced = _request(metadata=forced_metadata)
+
+        assert not wants_recompute(plain)
+        assert wants_recompute(forced)
+        assert LintResponseCache.make_key(forced) == LintResponseCache.make_key(plain)
+
+    def test_force_recompute_refreshes_entry_read_by_plain_requests(self):
+        cache = LintResponseCache()
+        cache.set(cache.make_key(_request()), _response(elapsed_ms=1.0))
+
+        # A forced request recomputes and stores under its key...
+        cache.set(
+            cache.make_key(_request(metadata={"force_recompute": True})),
+            _response(elapsed_ms=2.0),
+        )
+
+        # ...and a plain request then sees the fresh response
+        assert cache.get(cache.make_key(_request())).elapsed_ms == 2.0
@@ -0,0 +1,146 @@
+"""Tests for LintOrchestrator helpers."""
+
+import asyncio
+import logging
+
+import pytest
+
+from api.models.lint_models import DocumentProfile, Finding, FindingLocation, LintContext
+from api.orchestrator.lint_orchestrator import LintOrchestrator, _location_key
+from api.rules_library import RuleLibrary
+from api.rules_models import Severity
+
+
+def _finding(finding_id, location=None, agent_id="TEST"):
+    return Finding(
+        id=finding_id,
+        agent_id=agent_id,
+        severity=Severity.warning,
+        category="test",
+        message=finding_id,
+        location=location,
+    )
+
+
+class TestLocationKey:
+    """Test suite for the findings sort key."""
+
+    def test_sorts_by_line_then_offset_with_unlocated_first(self):
+        findings = [
+            _finding("line-3", FindingLocation(line=3, start_offset=40)),
+            _finding("line-1-late", FindingLocation(line=1, start_offset=9)),
+            _finding("unlocated"),
+            _finding("line-1-early", FindingLocation(line=1, start_offset=2)),
+            _finding("section-only", FindingLocation(section="RESUMEN")),
+        ]
+
+        findings.sort(key=_location_key)
+
+        assert [f.id for f in findings] == [
+            "unlocated",
+            "section-only",
+            "line-1-early",
+            "line-1-late",
+            "line-3",
+        ]
+
+
+class _FakeAgent:
+    """Stand-in for a BaseAgent that records how many agents run at once."""
+
+    def __init__(self, agent_id, tracker, delay=0.01, fail=False):
+        self.agent_id = agent_id
+        self.tracker = tracker
+        self.delay = delay
+        self.fail = fail
+
+    async def run(self, document_text, context, profile):
+        self.tracker["running"] += 1
+        self.tracker["peak"] = max(self.tracker["peak"], self.tracker["running"])
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("boom")
+            return [_finding(f"{self.agent_id}-1", agent_id=self.agent_id)]
+        finally:
+            self.tracker["running"] -= 1
+
+
+class TestLintOrchestratorAgents:
+    """Test suite for agent selection and bounded agent execution."""
+
+    @pytest.fixture
+    def orchestrator(self, tmp_path):
+        return LintOrchestrator(RuleLibrary(tmp_path), agent_concurrency=2)
+
+    @pytest.fixture
+    def tracker(self):
+        return {"running": 0, "peak": 0}
+
+    def _run(self, orchestrator, agents):
+        return asyncio.run(
+            orchestrator._run_agents(tuple(agents), "texto", LintContext(), DocumentProfile())
+        )
+
+    def test_concurrency_is_capped_per_call(self, orchestrator, tracker):
+        agents = [_FakeAgent(f"A{i}", tracker) for i in range(6)]
+
+        self._run(orchestrator, agents)
+
+        assert tracker["peak"] == 2
+
+    def test_concurrent_calls_do_not_share_the_cap(self, orchestrator, tracker):
+        agents = tuple(_FakeAgent(f"A{i}", tracker, delay=0.02) for i in range(4))
+
+        async def two_requests():
+            ctx, profile = LintContext(), DocumentProfile()
+            await asyncio.gather(
+                orchestrator._run_agents(agents, "uno", ctx, profile),
+                orchestrator._run_agents(agents, "dos", ctx, profile),
+            )
+
+        asyncio.run(two_requests())
+
+        assert tracker["peak"] == 4
+
+    def test_findings_keep_agent_order_when_agents_finish_out_of_order(
+        self, orchestrator, tracker
+    ):
+        agents = [
+            _FakeAgent("SLOW", tracker, delay=0.05),
+            _FakeAgent("FAST", tracker, delay=0.0),
+            _FakeAgent("MEDIUM", tracker, delay=0.02),
+        ]
+
+        findings = self._run(orchestrator, agents)
+
+        assert [f.agent_id for f in findings] == ["SLOW", "FAST", "MEDIUM"]
+
+    def test_failing_agent_is_logged_and_contributes_nothing(
+        self, orchestrator, tracker, caplog
+    ):
+        agents = [_FakeAgent("OK", tracker), _FakeAgent("BROKEN", tracker, fail=True)]
+
+        with caplog.at_level(logging.ERROR, logger="api.orchestrator.lint_orchestrator"):
+            findings = self._run(orchestrator, agents)
+
+        assert [f.agent_id for f in findings] == ["OK"]
+        assert "Agent BROKEN raised" in caplog.text
+
+    def test_each_event_loop_gets_its_own_semaphore(self, orchestrator, tracker):
+        agents = [_FakeAgent(f"A{i}", tracker) for i in range(3)]
+
+        # Repeated asyncio.run calls must not trip over a loop-bound semaphore
+        for _ in range(3):
+            assert len(self._run(orchestrator, agents)) == 3
+
+    def test_select_agents_for_unknown_ids_is_empty(self, orchestrator):
+        assert orchestrator._select(frozenset({"NOPE"})) == ()
+
+    def test_select_agents_keeps_registration_order(self, orchestrator):
+        selected = orchestrator._select(frozenset({"REFERENCES", "GENERALSTRUCTURE", "NOPE"}))
+
+        assert [a.agent_id for a in selected] == ["GENERALSTRUCTURE", "REFERENCES"]
+
+    def test_select_agents_without_ids_returns_all(self, orchestrator):
+        assert orchestrator._select(None) == tuple(orchestrator.agents)
@@ -0,0 +1,101 @@
+"""Route-level tests for POST /lint and its response cache."""
+
+import asyncio
+import inspect
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from api import main  # noqa: E402
+from api.models.lint_models import DocumentProfile, LintResponse, LintSummary  # noqa: E402
+
+
+class _CountingOrchestrator:
+    """Stub orchestrator that counts how many times the document is linted."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def lint_document(self, request):
+        self.calls += 1
+        return LintResponse(
+            success=True,
+            findings=[],
+            summary=LintSummary(error_count=0, warning_count=0, suggestion_count=0),
+            agents_run=["GENERALSTRUCTURE"],
+            elapsed_ms=float(self.calls),
+            profile=DocumentProfile(),
+            timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+
+
+class TestLintRoute:
+    """Test suite for the /lint endpoint."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        stub = _CountingOrchestrator()
+        main.app.dependency_overrides[main.get_orchestrator] = lambda: stub
+        main.lint_cache.clear()
+        yield stub
+        main.app.dependency_overrides.clear()
+        main.lint_cache.clear()
+
+    @pytest.fixture
+    def client(self, orchestrator):
+        return TestClient(main.app)
+
+    def test_identical_post_is_served_from_cache(self, client, orchestrator):
+        payload = {"document_text": "RESUMEN\nTexto de prueba."}
+
+        first = client.post("/lint", json=payload)
+        second = client.post("/lint", json=payload)
+
+        assert first.status_code == second.status_code == 200
+        assert orchestrator.calls == 1
+        assert second.json() == first.json()
+
+    def test_different_document_is_linted_again(self, client, orchestrator):
+        client.post("/lint", json={"document_text": "Documento A"})
+        client.post("/lint", json={"document_text": "Documento B"})
+
+        assert orchestrator.calls == 2
+
+    def test_force_recompute_refreshes_the_cached_response(self, client, orchestrator):
+        payload = {"document_text": "Documento"}
+        client.post("/lint", json=payload)
+
+        forced = client.post(
+            "/lint",
+            json={**payload, "context": {"metadata": {"force_recompute": True}}},
+        )
+        after = client.post("/lint", json=payload)
+
+        assert orchestrator.calls == 2
+        assert forced.json()["elapsed_ms"] == 2.0
+        assert after.json()["elapsed_ms"] == 2.0
+
+
+class TestDependencies:
+    """Providers injected with Depends must not need FastAPI's threadpool."""
+
+    @pytest.mark.parametrize("provider", ["get_rule_library", "get_orchestrator"])
+    def test_providers_are_async(self, provider):
+        assert inspect.iscoroutinefunction(getattr(main, provider))
+
+    def test_providers_return_process_singletons(self):
+        orchestrator = asyncio.run(main.get_orchestrator())
+
+        assert orchestrator is asyncio.run(main.get_orchestrator())
+        assert orchestrator.rule_library is asyncio.run(main.get_rule_library())
+
+    def test_health_lists_loaded_rule_agents(self):
+        response = TestClient(main.app).get("/health")
+
+        assert response.status_code == 200
+        assert "REFERENCES" in response.json()["rule_agents"]
@@ -0,0 +1,183 @@
+"""Tests for RuleLibrary loading and lookups."""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from api.rules_library import RuleLibrary
+
+SHIPPED_RULES_DIR = Path(__file__).resolve().parents[1] / "api" / "rules"
+
+
+def _rule(rule_id, source="APA7", title=None):
+    return {
+        "ruleId": rule_id,
+        "title": title or rule_id,
+        "description": "Regla de prueba.",
+        "source": source,
+        "baseStandard": "APA7",
+        "severity": "warning",
+        "checkType": "structural",
+        "examples": {"good": "bien", "bad": "mal"},
+        "detectionHints": {"scope": "document"},
+    }
+
+
+def _rule_file_json(agent_id, rules):
+    return json.dumps({"profileId": "apa7_cun", "agentId": agent_id, "rules": rules})
+
+
+def _write_rule_file(profile_dir, name, agent_id, rules):
+    path = profile_dir / f"{name}.rules.json"
+    path.write_text(_rule_file_json(agent_id, rules), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def profile_dir(tmp_path):
+    directory = tmp_path / "apa7_cun"
+    directory.mkdir()
+    return directory
+
+
+class TestRuleLibrary:
+    """Test suite for RuleLibrary."""
+
+    @pytest.fixture
+    def library(self, profile_dir):
+        _write_rule_file(
+            profile_dir,
+            "references",
+            "REFERENCES",
+            [_rule("REF-APA"), _rule("REF-LOCAL", source="LOCAL"), _rule("REF-MIXED", "MIXED")],
+        )
+        return RuleLibrary(profile_dir.parent)
+
+    @pytest.mark.parametrize(
+        "variant,expected",
+        [
+            (None, ["REF-APA", "REF-LOCAL", "REF-MIXED"]),
+            ("cun_official", ["REF-APA", "REF-LOCAL", "REF-MIXED"]),
+            ("apa7_international", ["REF-APA", "REF-MIXED"]),
+            ("APA7_INTERNATIONAL", ["REF-APA", "REF-MIXED"]),
+            ("unknown_variant", ["REF-APA", "REF-LOCAL", "REF-MIXED"]),
+        ],
+    )
+    def test_rules_for_agent_by_variant(self, library, variant, expected):
+        rules = library.get_rules_for_agent("REFERENCES", variant)
+
+        assert [rule.rule_id for rule in rules] == expected
+
+    def test_unknown_agent_has_no_rules(self, library):
+        assert library.get_rules_for_agent("NOPE") == []
+        assert library.get_rules_for_agent("NOPE", "apa7_international") == []
+
+    def test_missing_profile_dir_leaves_library_empty(self, tmp_path):
+        library = RuleLibrary(tmp_path)
+
+        assert library.get_all_agent_ids() == []
+        assert library.get_rule_by_id("REF-APA") is None
+
+    def test_duplicate_rule_id_keeps_first_appearance(self, profile_dir):
+        _write_rule_file(
+            profile_dir,
+            "a-references",
+            "REFERENCES",
+            [_rule("DUP-001", title="primera"), _rule("DUP-001", title="segunda")],
+        )
+        _write_rule_file(
+            profile_dir, "b-tables", "TABLESFIGURES", [_rule("DUP-001", title="otro archivo")]
+        )
+
+        library = RuleLibrary(profile_dir.parent)
+
+        assert library.get_rule_by_id("DUP-001").title == "primera"
+        assert library.get_all_agent_ids() == ["REFERENCES", "TABLESFIGURES"]
+
+    def test_shipped_rules_load(self):
+        library = RuleLibrary(SHIPPED_RULES_DIR)
+
+        assert "REFERENCES" in library.get_all_agent_ids()
+        assert library.get_rule_by_id("CUN-REF-001") is not None
+
+
+class TestRuleLibraryReloadOne:
+    """Test suite for RuleLibrary._reload_one (used by the file watcher)."""
+
+    @pytest.fixture
+    def library(self, profile_dir):
+        _write_rule_file(profile_dir, "references", "REFERENCES", [_rule("REF-001")])
+        _write_rule_file(profile_dir, "tables", "TABLESFIGURES", [_rule("TF-001")])
+        return RuleLibrary(profile_dir.parent)
+
+    def test_modified_file_replaces_its_rules(self, library, profile_dir):
+        path = _write_rule_file(profile_dir, "references", "REFERENCES", [_rule("REF-002")])
+
+        library._reload_one(path)
+
+        assert [r.rule_id for r in library.get_rules_for_agent("REFERENCES")] == ["REF-002"]
+        assert library.get_rule_by_id("REF-001") is None
+        assert library.get_rule_by_id("TF-001") is not None
+
+    def test_new_file_is_added(self, library, profile_dir):
+        path = _write_rule_file(profile_dir, "math", "MATHEQUATIONS", [_rule("ME-001")])
+
+        library._reload_one(path)
+
+        assert "MATHEQUATIONS" in library.get_all_agent_ids()
+        assert library.get_rule_by_id("ME-001") is not None
+
+    def test_deleted_file_drops_its_rules(self, library, profile_dir):
+        path = profile_dir / "references.rules.json"
+        path.unlink()
+
+        library._reload_one(path)
+
+        assert library.get_all_agent_ids() == ["TABLESFIGURES"]
+        assert library.get_rules_for_agent("REFERENCES") == []
+        assert library.get_rule_by_id("REF-001") is None
+
+    def test_changed_agent_id_removes_old_entry(self, library, profile_dir):
+        path = _write_rule_file(profile_dir, "references", "INTEXTCITATIONS", [_rule("REF-001")])
+
+        library._reload_one(path)
+
+        assert library.get_all_agent_ids() == ["INTEXTCITATIONS", "TABLESFIGURES"]
+        assert library.get_rules_for_agent("REFERENCES") == []
+
+    def test_invalid_file_keeps_previous_rules(self, library, profile_dir):
+        path = profile_dir / "references.rules.json"
+        path.write_text("{ a medio guardar", encoding="utf-8")
+
+        library._reload_one(path)
+
+        assert library.get_rule_by_id("REF-001") is not None
+
+    def test_non_rule_files_are_ignored(self, library, profile_dir):
+        path = profile_dir / "references.rules.json.tmp"
+        path.write_text("{}", encoding="utf-8")
+
+        library._reload_one(path)
+
+        assert library.get_all_agent_ids() == ["REFERENCES", "TABLESFIGURES"]
+
+    def test_watch_picks_up_atomic_rename(self, library, profile_dir):
+        pytest.importorskip("watchdog")
+
+        assert library.watch()
+        try:
+            # Editors that save atomically write a temp file and rename it
+            tmp = profile_dir / "references.rules.json~"
+            tmp.write_text(_rule_file_json("REFERENCES", [_rule("REF-009")]), encoding="utf-8")
+            tmp.replace(profile_dir / "references.rules.json")
+
+            deadline = time.monotonic() + 5.0
+            while library.get_rule_by_id("REF-009") is None and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            library.stop_watching()
+
+        assert library.get_rule_by_id("REF-009") is not None
+        assert library.get_rule_by_id("REF-001") is None
@@ -0,0 +1,58 @@
+"""Tests for RuleDetectionHints.compiled_regex."""
+
+import re
+
+import pytest
+
+from api.rules_models import RuleDetectionHints
+
+NBSP = "\u00a0"  # no-break space, common in Word-exported text
+
+
+def _hints(*patterns):
+    return RuleDetectionHints(scope="document", regex=list(patterns))
+
+
+class TestCompiledRegex:
+    """The compiled patterns must behave like `re`, whether or not google-re2 is installed."""
+
+    @pytest.mark.parametrize(
+        "pattern,text",
+        [
+            (r"^Tabla\s+\d+", f"Introducción\nTabla{NBSP}1"),
+            (r"Palabras clave\s*:", f"Palabras clave{NBSP}: APA"),
+            (r"^METODOLOG[ÍI]A\s*$", f"METODOLOGÍA{NBSP}\nTexto"),
+            (r"^Figura\s+\d+", "Figura ٣"),  # Arabic-Indic digit three
+        ],
+        ids=["nbsp_tabla", "nbsp_keywords", "nbsp_heading", "unicode_digit"],
+    )
+    def test_unicode_whitespace_and_digits_match(self, pattern, text):
+        (compiled,) = _hints(pattern).compiled_regex
+
+        assert re.search(pattern, text, re.MULTILINE)
+        assert compiled.search(text)
+
+    def test_multiline_anchors(self):
+        (compiled,) = _hints("^RESUMEN$").compiled_regex
+
+        assert compiled.search("Portada\nRESUMEN\nTexto")
+        assert not compiled.search("Portada RESUMEN Texto")
+
+    def test_invalid_patterns_are_skipped(self):
+        compiled = _hints("(", "REFERENCIAS").compiled_regex
+
+        assert len(compiled) == 1
+        assert compiled[0].search("REFERENCIAS")
+
+    def test_compiled_once(self):
+        hints = _hints("REFERENCIAS")
+
+        assert hints.compiled_regex is hints.compiled_regex
+
+    def test_re2_only_for_patterns_without_shorthand_classes(self):
+        pytest.importorskip("re2")
+        safe, unsafe = _hints("OBJETIVOS ESPEC[ÍI]FICOS", r"^Tabla\s+\d+").compiled_regex
+
+        assert not isinstance(safe, re.Pattern)
+        assert isinstance(unsafe, re.Pattern)
+        assert safe.search("OBJETIVOS ESPECÍFICOS")